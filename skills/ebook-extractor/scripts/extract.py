@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """
 Unified ebook text extractor.
-Auto-detects format and extracts text from EPUB, MOBI, and PDF files.
+Auto-detects format and extracts text from EPUB, MOBI, PDF, HTML and plain text files.
 """
 
+import hashlib
+import os
 import sys
 from pathlib import Path
 
@@ -11,6 +13,12 @@ from pathlib import Path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
+# Extracted text is cached by file digest, so edits to a book invalidate it
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'ebook-extractor'
+
+# Bump whenever an extractor's output changes, so stale cache entries are ignored
+CACHE_VERSION = 1
+
 
 def detect_format(file_path: str) -> str:
     """Detect ebook format from file extension."""
@@ -22,12 +30,59 @@ def detect_format(file_path: str) -> str:
         '.azw': 'mobi',
         '.azw3': 'mobi',
         '.pdf': 'pdf',
+        '.html': 'html',
+        '.htm': 'html',
+        '.xhtml': 'html',
+        '.txt': 'text',
+        '.md': 'text',
+        '.rst': 'text',
+        '.org': 'text',
     }
 
     return format_map.get(ext, 'unknown')
 
 
-def extract_text(file_path: str) -> str:
+def file_digest(file_path: str) -> str:
+    """Hash file contents with BLAKE2b, reading in 1 MB chunks."""
+    digest = hashlib.blake2b()
+
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def extract_text(file_path: str, use_cache: bool = True) -> str:
+    """Extract text from any supported ebook format, reusing cached results."""
+    # Plain text is as cheap to read as it is to hash
+    fmt = detect_format(file_path)
+
+    if not use_cache or fmt in ('text', 'unknown'):
+        return extract_text_uncached(file_path)
+
+    cache_path = CACHE_DIR / f"{file_digest(file_path)}.{fmt}.v{CACHE_VERSION}.txt"
+
+    if cache_path.exists():
+        return cache_path.read_text(encoding='utf-8')
+
+    text = extract_text_uncached(file_path)
+
+    # Write to a temp name and rename, so readers never see a partial file
+    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(text, encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        print(f"Warning: could not write cache: {e}", file=sys.stderr)
+
+    return text
+
+
+def extract_text_uncached(file_path: str) -> str:
     """Extract text from any supported ebook format."""
     fmt = detect_format(file_path)
 
@@ -43,17 +98,29 @@ def extract_text(file_path: str) -> str:
         from extract_pdf import extract_text_from_pdf
         return extract_text_from_pdf(file_path)
 
+    elif fmt == 'html':
+        from extract_html import extract_text_from_html
+        return extract_text_from_html(file_path)
+
+    elif fmt == 'text':
+        data = Path(file_path).read_bytes()
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError:
+            # Not UTF-8; Latin-1 maps every byte, so this can't fail
+            return data.decode('latin-1')
+
     else:
         print(f"Unsupported format: {Path(file_path).suffix}", file=sys.stderr)
-        print("Supported formats: .epub, .mobi, .azw, .azw3, .pdf", file=sys.stderr)
+        print("Supported formats: .epub, .mobi, .azw, .azw3, .pdf, .html, .htm, .xhtml, .txt, .md, .rst, .org", file=sys.stderr)
         sys.exit(1)
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: extract.py <ebook_file> [-o output_file]", file=sys.stderr)
+        print("Usage: extract.py <ebook_file> [-o output_file] [--no-cache]", file=sys.stderr)
         print("", file=sys.stderr)
-        print("Supported formats: EPUB, MOBI, AZW, AZW3, PDF", file=sys.stderr)
+        print("Supported formats: EPUB, MOBI, AZW, AZW3, PDF, HTML, XHTML, TXT, MD, RST, ORG", file=sys.stderr)
         sys.exit(1)
 
     file_path = sys.argv[1]
@@ -71,7 +138,7 @@ def main():
     fmt = detect_format(file_path)
     print(f"Detected format: {fmt.upper()}", file=sys.stderr)
 
-    text = extract_text(file_path)
+    text = extract_text(file_path, use_cache='--no-cache' not in sys.argv)
 
     if output_path:
         Path(output_path).write_text(text, encoding='utf-8')
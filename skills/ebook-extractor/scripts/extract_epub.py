@@ -1,41 +1,41 @@
 #!/usr/bin/env python3
 """Extract text from EPUB files."""
 
+import io
 import sys
 from pathlib import Path
 
 try:
     import ebooklib
     from ebooklib import epub
-    from bs4 import BeautifulSoup
 except ImportError as e:
     print(f"Missing dependency: {e}", file=sys.stderr)
-    print("Install with: pip install ebooklib beautifulsoup4", file=sys.stderr)
+    print("Install with: pip install ebooklib lxml", file=sys.stderr)
     sys.exit(1)
 
+# Import the HTML extractor
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+from extract_html import UTF8_HTML_PARSER, markup_to_text
+
 
 def extract_text_from_epub(epub_path: str) -> str:
     """Extract all text content from an EPUB file."""
     book = epub.read_epub(epub_path)
 
-    text_parts = []
+    buf = io.StringIO()
 
     for item in book.get_items():
         if item.get_type() == ebooklib.ITEM_DOCUMENT:
-            content = item.get_content().decode('utf-8', errors='ignore')
-            soup = BeautifulSoup(content, 'html.parser')
-
-            # Remove script and style elements
-            for element in soup(['script', 'style', 'nav']):
-                element.decompose()
-
-            # Get text with reasonable whitespace handling
-            text = soup.get_text(separator='\n', strip=True)
+            # EPUB requires UTF-8 (or UTF-16 with a BOM) content documents
+            text = markup_to_text(item.get_content(), UTF8_HTML_PARSER)
 
-            if text.strip():
-                text_parts.append(text)
+            if text:
+                if buf.tell():
+                    buf.write('\n\n')
+                buf.write(text)
 
-    return '\n\n'.join(text_parts)
+    return buf.getvalue()
 
 
 def main():
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Extract text from HTML and XHTML files."""
+
+import io
+import sys
+from pathlib import Path
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError as e:
+    print(f"Missing dependency: {e}", file=sys.stderr)
+    print("Install with: pip install lxml", file=sys.stderr)
+    sys.exit(1)
+
+# Elements whose text never belongs in the extracted output
+SKIP_TAGS = ('head', 'script', 'style', 'nav')
+
+# huge_tree lifts libxml2's default nesting limit of 256. HTML_PARSER sniffs
+# the declared charset; UTF8_HTML_PARSER is for content known to be UTF-8
+HTML_PARSER = lxml_html.HTMLParser(huge_tree=True)
+UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8', huge_tree=True)
+XML_PARSER = etree.XMLParser(huge_tree=True)
+
+# Well-formed documents above this size are streamed. Streaming is slower than
+# walking a parsed tree but keeps memory flat, which only pays off for large ones
+STREAM_THRESHOLD = 1 << 20
+
+
+def is_skipped(node) -> bool:
+    """Check if a node's own text is excluded (comments, PIs, SKIP_TAGS)."""
+    return not isinstance(node.tag, str) or etree.QName(node).localname in SKIP_TAGS
+
+
+def iter_text(elem):
+    """Yield the text nodes under elem in document order, leaving out skipped content."""
+    if is_skipped(elem):
+        return
+
+    yield elem.text
+
+    # An explicit stack rather than recursion, since documents can nest
+    # deeper than Python's recursion limit
+    stack = [(None, iter(elem))]
+
+    while stack:
+        parent, children = stack[-1]
+        child = next(children, None)
+
+        if child is None:
+            stack.pop()
+            if parent is not None:
+                yield parent.tail
+        elif is_skipped(child):
+            yield child.tail
+        else:
+            yield child.text
+            stack.append((child, iter(child)))
+
+
+def text_before(parent, node):
+    """Return the text in parent between node's previous element sibling and node.
+
+    With node=None, the gap runs to the end of parent. Comments, PIs and
+    unresolved entities in the gap contribute only their tails.
+    """
+    if node is not None:
+        prev = node.getprevious()
+    else:
+        prev = parent[-1] if len(parent) else None
+
+    pieces = []
+
+    while prev is not None and not isinstance(prev.tag, str):
+        pieces.append(prev.tail)
+        prev = prev.getprevious()
+
+    pieces.append(parent.text if prev is None else prev.tail)
+
+    return reversed(pieces)
+
+
+def write_text(buf: io.StringIO, pieces) -> None:
+    """Write stripped, non-empty text pieces to buf, one per line."""
+    for piece in pieces:
+        piece = piece.strip() if piece else ''
+
+        if piece:
+            if buf.tell():
+                buf.write('\n')
+            buf.write(piece)
+
+
+def xhtml_to_text(content: bytes) -> str:
+    """Stream text out of a well-formed XHTML document.
+
+    Elements are cleared as soon as their text has been written, so memory
+    stays flat however large the document is. Raises etree.XMLSyntaxError
+    if the content isn't well-formed XML.
+    """
+    buf = io.StringIO()
+    skip_depth = 0
+
+    # huge_tree lifts libxml2's default nesting limit of 256
+    events = etree.iterparse(io.BytesIO(content), events=('start', 'end'), huge_tree=True)
+
+    for event, elem in events:
+        if event == 'start':
+            # Everything up to this start tag has been parsed
+            parent = elem.getparent()
+            if parent is not None and not skip_depth:
+                write_text(buf, text_before(parent, elem))
+            if is_skipped(elem):
+                skip_depth += 1
+            continue
+
+        if not skip_depth:
+            write_text(buf, text_before(elem, None))
+        if is_skipped(elem):
+            skip_depth -= 1
+
+        # Drop the finished subtree; its tail is written by whatever comes next
+        elem.clear(keep_tail=True)
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    return buf.getvalue()
+
+
+def xhtml_tree_to_text(content: bytes) -> str:
+    """Extract text from a well-formed XHTML document by parsing it whole.
+
+    Raises etree.XMLSyntaxError if the content isn't well-formed XML.
+    """
+    root = etree.fromstring(content, parser=XML_PARSER)
+
+    buf = io.StringIO()
+    write_text(buf, iter_text(root))
+
+    return buf.getvalue()
+
+
+def html_to_text(content: bytes, parser=HTML_PARSER) -> str:
+    """Extract newline-separated text from an (X)HTML document."""
+    try:
+        tree = lxml_html.document_fromstring(content, parser=parser)
+    except etree.ParserError as e:
+        # An empty document is fine; anything else means lost text
+        if content.strip():
+            print(f"Warning: could not parse HTML, skipping: {e}", file=sys.stderr)
+        return ''
+
+    # Recoverable tag-soup errors are normal; fatal ones mean the tree was cut short
+    fatal = [e for e in parser.error_log if e.level == etree.ErrorLevels.FATAL]
+    if fatal:
+        print(f"Warning: HTML parse stopped early, text may be incomplete: {fatal[0].message}", file=sys.stderr)
+
+    # Only body text is content; <head> holds the title and metadata
+    body = tree.find('body')
+    if body is None:
+        body = tree
+
+    buf = io.StringIO()
+    write_text(buf, iter_text(body))
+
+    return buf.getvalue()
+
+
+def markup_to_text(content: bytes, parser=HTML_PARSER) -> str:
+    """Extract text from XHTML or HTML, parsing as XML first.
+
+    Large well-formed documents are streamed. parser is used for the HTML
+    fallback; pass UTF8_HTML_PARSER when the encoding is known to be UTF-8
+    (e.g. EPUB content documents).
+    """
+    try:
+        if len(content) > STREAM_THRESHOLD:
+            return xhtml_to_text(content)
+        return xhtml_tree_to_text(content)
+    except etree.XMLSyntaxError:
+        # Not well-formed XML (tag soup, HTML-only entities)
+        return html_to_text(content, parser)
+
+
+def extract_text_from_html(html_path: str) -> str:
+    """Extract all text content from an HTML or XHTML file."""
+    content = Path(html_path).read_bytes()
+
+    # libxml2 assumes Latin-1 for undeclared pages, but most are UTF-8; only
+    # content that isn't valid UTF-8 is left to its declared charset
+    try:
+        content.decode('utf-8')
+        parser = UTF8_HTML_PARSER
+    except UnicodeDecodeError:
+        parser = HTML_PARSER
+
+    return markup_to_text(content, parser)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: extract_html.py <html_file> [-o output_file]", file=sys.stderr)
+        sys.exit(1)
+
+    html_path = sys.argv[1]
+    output_path = None
+
+    if '-o' in sys.argv:
+        idx = sys.argv.index('-o')
+        if idx + 1 < len(sys.argv):
+            output_path = sys.argv[idx + 1]
+
+    if not Path(html_path).exists():
+        print(f"File not found: {html_path}", file=sys.stderr)
+        sys.exit(1)
+
+    text = extract_text_from_html(html_path)
+
+    if output_path:
+        Path(output_path).write_text(text, encoding='utf-8')
+        print(f"Extracted to: {output_path}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,43 +1,42 @@
 #!/usr/bin/env python3
 """Extract text from MOBI files using Calibre conversion."""
 
+import shutil
 import subprocess
 import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
-# Import the EPUB extractor
+# Make the EPUB extractor importable for the via_epub route
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
-from extract_epub import extract_text_from_epub
 
 
+@lru_cache(maxsize=1)
 def check_calibre():
     """Check if Calibre's ebook-convert is available."""
-    try:
-        subprocess.run(
-            ['ebook-convert', '--version'],
-            capture_output=True,
-            check=True
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return shutil.which('ebook-convert') is not None
 
 
-def extract_text_from_mobi(mobi_path: str) -> str:
-    """Extract text from MOBI by converting to EPUB first."""
+def extract_text_from_mobi(mobi_path: str, via_epub: bool = False) -> str:
+    """Extract text from MOBI using Calibre.
+
+    By default Calibre writes plain text directly. With via_epub, it converts
+    to EPUB and the EPUB extractor does the text pass instead.
+    """
     if not check_calibre():
         print("Error: Calibre not found. Install with: brew install calibre", file=sys.stderr)
         sys.exit(1)
 
-    # Convert MOBI to temporary EPUB
-    with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as tmp:
-        tmp_epub = tmp.name
+    # Calibre picks the output format from the suffix, so it needs a real file
+    suffix = '.epub' if via_epub else '.txt'
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        tmp_out = tmp.name
 
     try:
         result = subprocess.run(
-            ['ebook-convert', mobi_path, tmp_epub],
+            ['ebook-convert', mobi_path, tmp_out],
             capture_output=True,
             text=True
         )
@@ -46,17 +45,21 @@ def extract_text_from_mobi(mobi_path: str) -> str:
             print(f"Conversion failed: {result.stderr}", file=sys.stderr)
             sys.exit(1)
 
-        # Extract text from the converted EPUB
-        return extract_text_from_epub(tmp_epub)
+        if via_epub:
+            # Imported here so the default path doesn't need ebooklib
+            from extract_epub import extract_text_from_epub
+            return extract_text_from_epub(tmp_out)
+
+        return Path(tmp_out).read_text(encoding='utf-8')
 
     finally:
         # Clean up temp file
-        Path(tmp_epub).unlink(missing_ok=True)
+        Path(tmp_out).unlink(missing_ok=True)
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: extract_mobi.py <mobi_file> [-o output_file]", file=sys.stderr)
+        print("Usage: extract_mobi.py <mobi_file> [-o output_file] [--via-epub]", file=sys.stderr)
         sys.exit(1)
 
     mobi_path = sys.argv[1]
@@ -71,7 +74,7 @@ def main():
         print(f"File not found: {mobi_path}", file=sys.stderr)
         sys.exit(1)
 
-    text = extract_text_from_mobi(mobi_path)
+    text = extract_text_from_mobi(mobi_path, via_epub='--via-epub' in sys.argv)
 
     if output_path:
         Path(output_path).write_text(text, encoding='utf-8')
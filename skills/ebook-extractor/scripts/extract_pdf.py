@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """Extract text from PDF files using PyMuPDF."""
 
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -11,23 +14,68 @@ except ImportError:
     print("Install with: pip install PyMuPDF", file=sys.stderr)
     sys.exit(1)
 
+# Below this many pages per worker, process startup costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 50
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract all text content from a PDF file."""
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> list:
+    """Extract (page_num, text) pairs for pages in [start, stop)."""
+    # Each worker opens its own document; MuPDF objects can't cross processes
     doc = fitz.open(pdf_path)
 
-    text_parts = []
+    pages = []
 
-    for page_num in range(len(doc)):
+    for page_num in range(start, stop):
         page = doc[page_num]
-        text = page.get_text()
+
+        # With no fonts of its own and no annotations or form fields (which
+        # draw text from their own appearance streams), a page has no text,
+        # e.g. a scanned image. These lookups are far cheaper than extraction
+        if not page.get_fonts() and page.first_annot is None and page.first_widget is None:
+            continue
+
+        text = page.get_text('text')
 
         if text.strip():
-            text_parts.append(text)
+            pages.append((page_num, text))
 
     doc.close()
 
-    return '\n\n'.join(text_parts)
+    return pages
+
+
+def extract_text_from_pdf(pdf_path: str) -> str:
+    """Extract all text content from a PDF file."""
+    doc = fitz.open(pdf_path)
+    page_count = len(doc)
+    doc.close()
+
+    # Give each worker at least PARALLEL_PAGE_THRESHOLD pages
+    workers = min(os.cpu_count() or 1, page_count // PARALLEL_PAGE_THRESHOLD)
+
+    if workers <= 1:
+        pages = _extract_page_range(pdf_path, 0, page_count)
+    else:
+        chunk_size = -(-page_count // workers)
+        starts = range(0, page_count, chunk_size)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_extract_page_range, pdf_path, start, min(start + chunk_size, page_count))
+                for start in starts
+            ]
+            pages = [page for future in futures for page in future.result()]
+
+        pages.sort()
+
+    buf = io.StringIO()
+
+    for _, text in pages:
+        if buf.tell():
+            buf.write('\n\n')
+        buf.write(text)
+
+    return buf.getvalue()
 
 
 def main():